@@ -6,6 +6,40 @@ Cross-platform installation script for Simple Print Server
 import sys
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of parallel pip workers for the initial download/install pass
+PARALLEL_INSTALL_WORKERS = 4
+
+def run_streamed(cmd):
+    """Run a subprocess, streaming its output line by line to stdout.
+
+    Unlike check_call with inherited stdio, this keeps draining the pipe
+    even when the installer itself is run with captured output (e.g. CI
+    log capture), so verbose pip output can never fill the OS pipe
+    buffer and stall the install. Raises CalledProcessError on failure,
+    matching check_call semantics.
+    """
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        bufsize=-1, text=True
+    )
+    for line in proc.stdout:
+        sys.stdout.write(line)
+    proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+def get_pip_cache_dir():
+    """Return a project-local pip cache directory, creating it if needed.
+
+    Pointing pip at a cache next to the project means re-runs of the
+    installer reuse downloaded wheels and HTTP responses instead of
+    hitting PyPI again.
+    """
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pip-cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
 
 def print_header(text):
     """Print a formatted header"""
@@ -33,36 +67,117 @@ def check_python():
     print()
     return True
 
-def upgrade_pip():
-    """Upgrade pip to latest version"""
-    print_step("2/3", "Upgrading pip...")
-    
+# Minimum pip version considered "recent enough" to skip the upgrade step
+MINIMUM_PIP_VERSION = "23.0"
+
+# Set when pip is stale; the upgrade is then folded into the main install
+# call instead of spawning a separate pip process (each pip CLI start costs
+# ~0.3s of resolver/cache bootstrap)
+_pip_upgrade_pending = False
+
+def pip_is_recent():
+    """Check in-process whether the installed pip is already recent enough"""
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "--upgrade", "pip", "--quiet"
-        ])
-        print("✓ pip upgraded")
+        import pip
+        from packaging.version import Version  # ships with pip
+        return Version(pip.__version__) >= Version(MINIMUM_PIP_VERSION)
+    except Exception:
+        return False
+
+def upgrade_pip():
+    """Mark pip for upgrade when stale (done in the main install call).
+
+    Instead of spawning its own 'pip install --upgrade pip' subprocess,
+    this just flags the upgrade so install_requirements can do it in the
+    same pip invocation as the package install - one CLI bootstrap and
+    one resolver pass instead of two.
+    """
+    global _pip_upgrade_pending
+
+    print_step("2/3", "Checking pip version...")
+
+    if pip_is_recent():
+        print("✓ pip is already recent, skipping upgrade")
         print()
         return True
+
+    _pip_upgrade_pending = True
+    print("pip is outdated - it will be upgraded together with the packages")
+    print()
+    return True
+
+def read_requirements(requirements_file):
+    """Read package lines from requirements.txt, skipping comments and includes"""
+    packages = []
+    with open(requirements_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or line.startswith("-"):
+                continue
+            packages.append(line)
+    return packages
+
+def install_packages_parallel(requirements_file):
+    """Download and install packages in parallel, then reconcile dependencies.
+
+    Fresh installs are dominated by network I/O, so fetching each package in
+    its own pip subprocess (with --no-deps) uses multiple connections at once.
+    A final 'pip install -r requirements.txt' pass fills in any dependency
+    edges the parallel pass skipped.
+    """
+    packages = read_requirements(requirements_file)
+    cache_dir = get_pip_cache_dir()
+
+    def install_one(package):
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install", package, "--no-deps", "--quiet",
+            "--cache-dir", cache_dir, "--only-binary=:all:"
+        ])
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_INSTALL_WORKERS) as executor:
+        for future in [executor.submit(install_one, pkg) for pkg in packages]:
+            future.result()  # Re-raise any worker failure
+
+    # Reconcile: install any transitive dependencies the --no-deps pass skipped.
+    # Binary-only first (skips slow source builds when wheels exist), then
+    # retry allowing sdists if some package has no wheel for this platform.
+    reconcile_cmd = [
+        sys.executable, "-m", "pip", "install", "-r", requirements_file,
+        "--cache-dir", cache_dir, "--prefer-binary"
+    ]
+    if _pip_upgrade_pending:
+        # Upgrade pip in the same invocation - pip supports upgrading itself
+        # while installing requirements
+        reconcile_cmd[4:4] = ["--upgrade", "pip"]
+    try:
+        run_streamed(reconcile_cmd + ["--only-binary=:all:"])
     except subprocess.CalledProcessError:
-        print("⚠ Warning: Failed to upgrade pip, continuing anyway...")
-        print()
-        return True  # Non-critical, continue anyway
+        print("⚠ Binary-only install failed, retrying with source builds allowed...")
+        run_streamed(reconcile_cmd)
 
 def install_requirements():
     """Install required packages from requirements.txt"""
     print_step("2/3", "Installing Python packages...")
-    
+
     requirements_file = os.path.join(os.path.dirname(__file__), "requirements.txt")
-    
+
     if not os.path.exists(requirements_file):
         print(f"ERROR: {requirements_file} not found!")
         return False
-    
+
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", requirements_file
-        ])
+        try:
+            install_packages_parallel(requirements_file)
+        except Exception:
+            # Fall back to the plain single-call path (preserves error reporting)
+            print("⚠ Parallel install failed, retrying sequentially...")
+            fallback_cmd = [
+                sys.executable, "-m", "pip", "install", "-r", requirements_file,
+                "--cache-dir", get_pip_cache_dir()
+            ]
+            if _pip_upgrade_pending:
+                fallback_cmd[4:4] = ["--upgrade", "pip"]
+            run_streamed(fallback_cmd)
         print("✓ Packages installed successfully")
         print()
         return True
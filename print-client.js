@@ -73,21 +73,23 @@ class SimplePrintClient {
 
     /**
      * Connect to a printer by name or ID from the printer list
-     * @param {string|number} nameOrId - Printer name or ID from the list
+     * @param {string} nameOrId - Printer name or ID from the list
      * @param {string} [printerId] - Optional custom ID for this printer connection (defaults to printer name)
      * @returns {Promise<Object>} Response with printer_id and printer_name
      * @example
      * // Connect using printer ID from list
-     * await printer.connectByName(0, 'counter');
-     * 
+     * const printers = await printer.listPrinters();
+     * await printer.connectByName(printers[0].id, 'counter');
+     *
      * @example
      * // Connect using printer name
      * await printer.connectByName('HP LaserJet', 'receipt-printer');
      */
     async connectByName(nameOrId, printerId = null) {
         try {
-            const isId = typeof nameOrId === 'number' || /^\d+$/.test(nameOrId);
-            const payload = isId ? { id: parseInt(nameOrId) } : { name: nameOrId };
+            // Printer IDs are opaque strings, so pass the value through
+            // untouched - the server tries it as an ID first, then as a name
+            const payload = { id: nameOrId };
             
             if (printerId) {
                 payload.printer_id = printerId;
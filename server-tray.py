@@ -5,20 +5,24 @@ Runs the print server in the system tray with a menu
 """
 
 import threading
-import webbrowser
 import sys
 import os
+import time
 import logging
-from pathlib import Path
+import importlib.util
 from datetime import datetime
 
-# Try to import pystray for system tray
-try:
-    import pystray
-    from PIL import Image, ImageDraw
-    TRAY_AVAILABLE = True
-except ImportError:
-    TRAY_AVAILABLE = False
+# Paths resolved once at import - os.path strings are cheaper than building
+# pathlib objects in the menu callbacks that use them
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_EXAMPLE_PATH = os.path.join(_SCRIPT_DIR, 'example.html')
+
+# Check for pystray/Pillow without importing them - the actual imports are
+# deferred until the tray is really used, so console mode never pays the
+# import cost (Pillow alone is heavy)
+TRAY_AVAILABLE = (importlib.util.find_spec("pystray") is not None
+                  and importlib.util.find_spec("PIL") is not None)
+if not TRAY_AVAILABLE:
     print("=" * 60)
     print("System Tray Mode Not Available")
     print("=" * 60)
@@ -43,45 +47,134 @@ except ImportError:
 
 # Global variables
 server_thread = None
-server_running = False
 icon = None
 log_file_path = None
+log_buffer_handler = None
+
+# Set while the Flask server thread is serving. An Event is atomic to read
+# from the menu callbacks and safe to set/clear from the server thread,
+# unlike the unsynchronized bool it replaces.
+_server_event = threading.Event()
+
+# Waitress server instance (when waitress is installed) - kept so
+# stop_server/quit_app can shut it down cleanly via close()
+_waitress_server = None
+
+# Number of worker threads for the waitress server
+SERVER_THREADS = 4
+
+# Log rotation / buffering settings
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 3
+LOG_BUFFER_CAPACITY = 256  # records buffered before a batched write
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that caches the formatted timestamp at second granularity.
+
+    The default formatTime runs strftime plus microsecond formatting for
+    every record, which dominates logging CPU under per-request load.
+    Records emitted within the same second reuse the cached string.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ''
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime('%Y-%m-%d %H:%M:%S',
+                                           time.localtime(record.created))
+        return self._last_str
 
 # Setup logging
 def setup_logging():
-    """Setup logging to file"""
-    global log_file_path
-    
+    """Setup logging to a rotating, write-buffered file"""
+    global log_file_path, log_buffer_handler
+
+    import atexit
+    from logging.handlers import RotatingFileHandler, MemoryHandler
+
     # Create logs directory if it doesn't exist
-    log_dir = Path(__file__).parent / 'logs'
-    log_dir.mkdir(exist_ok=True)
-    
+    log_dir = os.path.join(_SCRIPT_DIR, 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+
     # Create log file with timestamp
     timestamp = datetime.now().strftime('%Y%m%d')
-    log_file_path = log_dir / f'server-{timestamp}.log'
-    
+    log_file_path = os.path.join(log_dir, f'server-{timestamp}.log')
+
+    # Rotate so the log file stays bounded (also keeps the tail-read viewer
+    # fast), and buffer records in memory so routine INFO logging is batched
+    # into fewer write() syscalls. Warnings and above flush immediately.
+    file_handler = RotatingFileHandler(
+        log_file_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+        encoding='utf-8'
+    )
+    buffered_handler = MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING,
+        target=file_handler
+    )
+    atexit.register(buffered_handler.flush)  # Don't lose buffered records on exit
+    log_buffer_handler = buffered_handler  # The log viewer flushes this on demand
+
+    stream_handler = logging.StreamHandler(sys.stdout)  # Also log to console
+
+    # One formatter with a cached per-second timestamp for both handlers
+    formatter = CachedTimeFormatter(LOG_FORMAT)
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file_path, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)  # Also log to console
-        ]
+        handlers=[buffered_handler, stream_handler]
     )
-    
+
     return logging.getLogger(__name__)
 
 # Initialize logger
 logger = setup_logging()
 
 
+# Cached tray icon image - drawn once, reused for every later request
+_tray_icon_image = None
+
+# Shared hidden Tk root - Tk() init loads the whole Tcl interpreter
+# (~100-300 ms), so one root is created on first use and reused by every
+# dialog instead of being rebuilt per click
+_tk_root = None
+
+
+def _get_tk_root():
+    """Return the shared hidden Tk root, creating it on first use"""
+    global _tk_root
+
+    import tkinter as tk
+
+    if _tk_root is None:
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()
+    return _tk_root
+
+
 def create_tray_icon():
-    """Create a simple tray icon image"""
+    """Create (once) and return the tray icon image"""
+    global _tray_icon_image
+
+    if _tray_icon_image is not None:
+        return _tray_icon_image
+
+    from PIL import Image, ImageDraw
+
     # Create a 64x64 image with a printer icon
     image = Image.new('RGB', (64, 64), color='white')
     draw = ImageDraw.Draw(image)
-    
+
     # Draw a simple printer icon
     # Printer body
     draw.rectangle([10, 20, 54, 50], fill='black', outline='black')
@@ -89,20 +182,21 @@ def create_tray_icon():
     draw.rectangle([20, 10, 44, 20], fill='white', outline='black')
     # Button
     draw.ellipse([45, 25, 50, 30], fill='white', outline='black')
-    
+
+    _tray_icon_image = image
     return image
 
 
 def start_server():
     """Start the Flask server in a separate thread"""
-    global server_thread, server_running, icon
-    
-    if server_running:
+    global server_thread, icon
+
+    if _server_event.is_set():
         return
-    
+
     def run_server():
-        global server_running
-        server_running = True
+        global _waitress_server
+        _server_event.set()
         try:
             logger.info("=" * 60)
             logger.info("Simple Print Server - Starting")
@@ -111,122 +205,182 @@ def start_server():
             logger.info("Server starting on http://127.0.0.1:8888")
             logger.info("=" * 60)
             print("Print server started on http://127.0.0.1:8888")
-            app.run(host='127.0.0.1', port=8888, debug=False, use_reloader=False)
+            try:
+                # Prefer waitress: a real thread pool for concurrent print
+                # requests and a close() hook for clean shutdown
+                from waitress import create_server
+                _waitress_server = create_server(
+                    app, host='127.0.0.1', port=8888, threads=SERVER_THREADS
+                )
+                _waitress_server.run()
+            except ImportError:
+                # Fall back to the Flask dev server (threaded so requests
+                # don't serialize)
+                app.run(host='127.0.0.1', port=8888, debug=False,
+                        use_reloader=False, threaded=True)
         except Exception as e:
             logger.error(f"Server error: {e}")
             print(f"Server error: {e}")
         finally:
-            server_running = False
+            _server_event.clear()
             logger.info("Server stopped")
     
-    server_thread = threading.Thread(target=run_server, daemon=True)
+    server_thread = threading.Thread(target=run_server, name='print-server',
+                                     daemon=True)
     server_thread.start()
 
 
 def stop_server():
     """Stop the Flask server"""
-    global server_running, icon
-    # Note: This is a workaround - Flask dev server doesn't have clean shutdown
-    # The server will stop when the process exits
-    server_running = False
-    print("Print server will stop on next restart")
+    global icon, _waitress_server
+
+    if _waitress_server is not None:
+        try:
+            _waitress_server.close()
+        except Exception as e:
+            logger.error(f"Error stopping server: {e}")
+        _waitress_server = None
+        print("Print server stopped")
+    else:
+        # Note: This is a workaround - Flask dev server doesn't have clean
+        # shutdown. The server will stop when the process exits.
+        print("Print server will stop on next restart")
+
+    _server_event.clear()
     if icon:
         icon.update_menu()
 
 
 def open_example_page(icon_item=None, item=None):
     """Open the example HTML page in default browser"""
-    example_path = Path(__file__).parent / 'example.html'
-    if example_path.exists():
-        webbrowser.open(f'file:///{example_path.absolute()}')
+    import webbrowser
+    if os.path.exists(_EXAMPLE_PATH):
+        webbrowser.open(f'file:///{_EXAMPLE_PATH}')
     else:
         webbrowser.open('http://localhost:8888')
 
 
 def open_server_status(icon_item=None, item=None):
     """Open server health check page"""
+    import webbrowser
     webbrowser.open('http://localhost:8888/health')
 
 
 def open_log_file(icon_item=None, item=None):
     """Open log file in default text editor or show in window"""
     global log_file_path
-    
-    if log_file_path and log_file_path.exists():
+
+    # Same flush as _read_log_tail - the editor reads the file directly
+    if log_buffer_handler is not None:
+        log_buffer_handler.flush()
+
+    if log_file_path and os.path.exists(log_file_path):
         try:
             # Try to open with default text editor (Windows)
-            os.startfile(str(log_file_path))
+            os.startfile(log_file_path)
         except AttributeError:
             # For non-Windows systems
             import subprocess
             import platform
             if platform.system() == 'Darwin':  # macOS
-                subprocess.call(['open', str(log_file_path)])
+                subprocess.call(['open', log_file_path])
             else:  # Linux
-                subprocess.call(['xdg-open', str(log_file_path)])
+                subprocess.call(['xdg-open', log_file_path])
         except Exception as e:
             logger.error(f"Failed to open log file: {e}")
             # Fallback: show in message box
             show_log_in_window()
     else:
         # Show error message
-        import tkinter as tk
         from tkinter import messagebox
-        
-        root = tk.Tk()
-        root.withdraw()
-        messagebox.showwarning("Log File", "Log file not found or not created yet.")
-        root.destroy()
+
+        messagebox.showwarning("Log File", "Log file not found or not created yet.",
+                               parent=_get_tk_root())
+
+
+# How much of the log file to read when viewing it (bytes from EOF / lines shown)
+LOG_TAIL_BYTES = 256 * 1024
+LOG_TAIL_LINES = 2000
+
+
+def _read_log_tail():
+    """Read the tail of the log file without loading the whole file.
+
+    Seeks near EOF and reads a bounded buffer, so viewing/refreshing the
+    log stays constant-time and constant-memory no matter how large the
+    log file has grown.
+    """
+    global log_file_path
+
+    # Push any records still sitting in the memory buffer out to the file
+    # first, otherwise recent INFO lines wouldn't show up until the buffer
+    # fills or a warning forces a flush
+    if log_buffer_handler is not None:
+        log_buffer_handler.flush()
+
+    if not (log_file_path and os.path.exists(log_file_path)):
+        return "Log file not found or not created yet."
+
+    try:
+        size = os.path.getsize(log_file_path)
+        with open(log_file_path, 'rb') as f:
+            f.seek(max(0, size - LOG_TAIL_BYTES))
+            tail = f.read().decode('utf-8', errors='replace')
+
+        lines = tail.split('\n')
+        if size > LOG_TAIL_BYTES or len(lines) > LOG_TAIL_LINES:
+            tail = f"... (showing last {LOG_TAIL_LINES} lines)\n\n" + "\n".join(lines[-LOG_TAIL_LINES:])
+        return tail
+    except Exception as e:
+        return f"Error reading log file: {e}"
+
+
+# Chunk size for streaming text into the log viewer widget
+LOG_INSERT_CHUNK = 8192
+
+
+def _fill_text_widget(text_widget, content):
+    """Replace the widget's content, inserting in chunks.
+
+    A single insert of a few hundred KB blocks the Tk event loop until
+    the full re-layout finishes; inserting in chunks with
+    update_idletasks between them keeps the window responsive and shows
+    text immediately.
+    """
+    import tkinter as tk
+
+    text_widget.config(state=tk.NORMAL)
+    text_widget.delete('1.0', tk.END)
+    for i in range(0, len(content), LOG_INSERT_CHUNK):
+        text_widget.insert(tk.END, content[i:i + LOG_INSERT_CHUNK])
+        text_widget.update_idletasks()
+    text_widget.config(state=tk.DISABLED)
+    text_widget.see(tk.END)  # Scroll to bottom
 
 
 def show_log_in_window():
     """Show log file content in a window"""
-    global log_file_path
-    
     import tkinter as tk
     from tkinter import scrolledtext
-    
-    root = tk.Tk()
+
+    root = tk.Toplevel(_get_tk_root())
     root.title("Server Log")
     root.geometry("900x700")
-    
-    # Read log file
-    log_content = ""
-    if log_file_path and log_file_path.exists():
-        try:
-            with open(log_file_path, 'r', encoding='utf-8') as f:
-                log_content = f.read()
-                # Show last 2000 lines if too long
-                if len(log_content) > 50000:
-                    lines = log_content.split('\n')
-                    log_content = "... (showing last 2000 lines)\n\n" + "\n".join(lines[-2000:])
-        except Exception as e:
-            log_content = f"Error reading log file: {e}"
-    else:
-        log_content = "Log file not found or not created yet."
-    
+
+    # Read log file (bounded tail read)
+    log_content = _read_log_tail()
+
     # Create text widget
     text_widget = scrolledtext.ScrolledText(root, wrap=tk.WORD, width=120, height=40, font=('Consolas', 9))
     text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-    text_widget.insert('1.0', log_content)
-    text_widget.config(state=tk.DISABLED)
-    
+    _fill_text_widget(text_widget, log_content)
+
     # Add refresh button
     def refresh_log():
-        if log_file_path and log_file_path.exists():
-            try:
-                with open(log_file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if len(content) > 50000:
-                        lines = content.split('\n')
-                        content = "... (showing last 2000 lines)\n\n" + "\n".join(lines[-2000:])
-                text_widget.config(state=tk.NORMAL)
-                text_widget.delete('1.0', tk.END)
-                text_widget.insert('1.0', content)
-                text_widget.config(state=tk.DISABLED)
-                text_widget.see(tk.END)  # Scroll to bottom
-            except Exception as e:
-                pass
+        try:
+            _fill_text_widget(text_widget, _read_log_tail())
+        except Exception as e:
+            pass
     
     button_frame = tk.Frame(root)
     button_frame.pack(pady=5)
@@ -237,38 +391,48 @@ def show_log_in_window():
     close_btn = tk.Button(button_frame, text="Close", command=root.destroy)
     close_btn.pack(side=tk.LEFT, padx=5)
     
-    # Auto-scroll to bottom
-    text_widget.see(tk.END)
-    
-    root.mainloop()
+    # Process events until the window is closed (the shared root has no
+    # running mainloop of its own)
+    root.wait_window(root)
 
 
-def show_about(icon_item=None, item=None):
-    """Show about dialog"""
-    import tkinter as tk
-    from tkinter import messagebox
-    
-    root = tk.Tk()
-    root.withdraw()  # Hide main window
-    
-    about_text = """Simple Print Server
+# About text is invariant after import - freeze it once instead of
+# rebuilding the string on every click
+_ABOUT_TEXT = f"""Simple Print Server
 Thermal Printer Bridge
 
 A lightweight alternative to QZ Tray
 No certificates required!
 
 Server: http://localhost:8888
-ESC/POS Available: """ + str(ESCPOS_AVAILABLE)
-    
-    messagebox.showinfo("About", about_text)
-    root.destroy()
+ESC/POS Available: {ESCPOS_AVAILABLE}"""
+
+
+def show_about(icon_item=None, item=None):
+    """Show about dialog"""
+    from tkinter import messagebox
+
+    messagebox.showinfo("About", _ABOUT_TEXT, parent=_get_tk_root())
 
 
 def quit_app(icon_item=None, item=None):
     """Quit the application"""
-    global icon, server_running
-    
-    server_running = False
+    global icon, _waitress_server
+
+    if _waitress_server is not None:
+        try:
+            _waitress_server.close()
+        except Exception:
+            pass
+        _waitress_server = None
+
+    _server_event.clear()
+
+    # Give the server thread a moment to release its socket so a relaunch
+    # doesn't hit "address already in use"; don't hang Quit if it won't stop
+    if server_thread is not None and server_thread.is_alive():
+        server_thread.join(timeout=2.0)
+
     if icon:
         icon.stop()
     sys.exit(0)
@@ -276,14 +440,16 @@ def quit_app(icon_item=None, item=None):
 
 def create_menu():
     """Create the system tray menu"""
+    import pystray
+
     def get_status_text(menu_item=None):
-        return f"Server: {'Running ✓' if server_running else 'Stopped ✗'}"
-    
+        return f"Server: {'Running ✓' if _server_event.is_set() else 'Stopped ✗'}"
+
     def can_start(menu_item=None):
-        return not server_running
-    
+        return not _server_event.is_set()
+
     def can_restart(menu_item=None):
-        return server_running
+        return _server_event.is_set()
     
     menu_items = [
         pystray.MenuItem(get_status_text, lambda icon_item=None, item=None: None, enabled=False),
@@ -323,7 +489,8 @@ def main():
         app.run(host='127.0.0.1', port=8888, debug=False)
         return
     
-    # Create tray icon
+    # Create tray icon (pystray/Pillow are only imported here, on first use)
+    import pystray
     image = create_tray_icon()
     icon = pystray.Icon("Simple Print Server", image, "Simple Print Server", create_menu())
     
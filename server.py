@@ -4,14 +4,23 @@ Simple Print Server for Thermal Printers
 A lightweight alternative to QZ Tray without certificate requirements
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, stream_with_context
 from flask_cors import CORS
 import sys
 import json
+import csv
+import io
+import hashlib
 import platform
 import subprocess
 import re
+import time
+import base64
+import threading
+import queue
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Setup basic logging
 logging.basicConfig(
@@ -31,11 +40,221 @@ except ImportError:
     ESCPOS_AVAILABLE = False
     print("Warning: python-escpos not installed. Using raw printing mode.")
 
+# Try to import win32print once at module scope - the old inline `import
+# win32print` statements still paid an import-lock acquisition and a
+# sys.modules lookup on every print job
+try:
+    import win32print
+    WIN32PRINT_AVAILABLE = True
+except ImportError:
+    win32print = None
+    WIN32PRINT_AVAILABLE = False
+
+# Try to import orjson for faster JSON parsing/serialization (C
+# implementation, 2-6x faster than stdlib json on large payloads)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Try to import fastjsonschema for request validation - it code-generates
+# plain-Python validator functions, roughly 10x faster than jsonschema
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    fastjsonschema = None
+    FASTJSONSCHEMA_AVAILABLE = False
+
+
+def _parse_json_request():
+    """Parse the request body as JSON, using orjson when available.
+
+    Returns None for an empty or unparseable body, matching how the
+    endpoints treat a missing request.json. cache=False skips Flask's
+    copy of the parsed body - each handler reads it exactly once.
+    """
+    if ORJSON_AVAILABLE:
+        body = request.get_data(cache=False)
+        if not body:
+            return None
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return None
+    return request.get_json(cache=False, silent=True)
+
+
+def _compile_validator(schema):
+    """Compile a JSON schema into a validator closure, or None.
+
+    Validation is optional: without fastjsonschema installed the
+    endpoints behave exactly as before, relying on their own checks.
+    """
+    if FASTJSONSCHEMA_AVAILABLE:
+        return fastjsonschema.compile(schema)
+    return None
+
+
+def _validation_error(validator, data):
+    """Run a compiled validator, returning an error message or None"""
+    if validator is None or data is None:
+        return None
+    try:
+        validator(data)
+    except fastjsonschema.JsonSchemaException as e:
+        return str(e)
+    return None
+
+
+# Schemas stay permissive on purpose - they reject only shapes the
+# handlers could not process, not merely unusual ones
+_validate_connect = _compile_validator({
+    'type': 'object',
+    'properties': {
+        'printer_id': {'type': 'string'},
+        'name': {'type': 'string'},
+        'type': {'type': 'string'},
+        'config': {'type': 'object'},
+    },
+})
+
+_validate_disconnect = _compile_validator({
+    'type': 'object',
+    'properties': {
+        'printer_id': {'type': 'string'},
+    },
+})
+
+_validate_print = _compile_validator({
+    'type': 'object',
+    'properties': {
+        'printer_id': {'type': 'string'},
+        'type': {'enum': ['text', 'raw', 'escpos']},
+        'encoding': {'enum': ['hex', 'base64']},
+        'commands': {'type': 'array'},
+        'cut': {'type': 'boolean'},
+        'async': {'type': 'boolean'},
+    },
+})
+
+
+def _json_response(payload):
+    """Serialize a JSON response with orjson when available.
+
+    Returns a Response object; combine with a status code tuple at the
+    call site just like jsonify (e.g. `return _json_response({...}), 400`).
+    """
+    if ORJSON_AVAILABLE:
+        return app.response_class(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
+
+
+def _json_bytes(obj):
+    """Serialize one object to JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 # Global printer instances - dictionary to support multiple printers
-# Key: printer_id (string), Value: dict with 'instance', 'type', 'config', 'name'
-printers = {}  # {printer_id: {'instance': printer_obj, 'type': str, 'config': dict, 'name': str}}
+# Key: printer_id (string), Value: dict with 'instance', 'type', 'config',
+# 'name' and a per-printer 'lock'
+printers = {}  # {printer_id: {'instance': printer_obj, 'type': str, 'config': dict, 'name': str, 'lock': Lock}}
 printer_list_cache = []  # Cache of available printers
 
+# O(1) lookup indexes over printer_list_cache, rebuilt on every cache
+# fill so connect_printer_by_name doesn't scan the list per request
+printer_id_index = {}  # {printer id (str): printer dict}
+printer_name_index = {}  # {printer name (str): printer dict}
+
+# ETag of the cached printer list, recomputed on every cache fill so
+# polling clients sending If-None-Match get a body-less 304
+_printer_list_etag = ''
+
+# Cached at import - platform.system() re-invokes uname on every call
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
+_IS_LINUX = _SYSTEM == 'Linux'
+_IS_DARWIN = _SYSTEM == 'Darwin'
+
+# Guards mutations of the printers dict - the WSGI server handles requests
+# on multiple threads. Each printer entry also carries its own lock so two
+# concurrent print jobs to the same printer can't interleave their bytes
+# inside the instance buffer.
+_printers_lock = threading.RLock()
+
+# Background print jobs submitted with "async": true. Each printer entry
+# carries a single-worker executor so jobs to the same printer stay in
+# order; futures are kept here so /printer/job/<id> can report status.
+_print_jobs = {}  # {job_id: Future}
+_print_jobs_lock = threading.Lock()
+_next_job_id = 1
+_PRINT_JOBS_MAX = 256  # completed jobs are pruned past this many entries
+
+
+# ESC/POS command constants - hoisted so the hot paths never rebuild the
+# same byte sequences per call
+ESC_CUT = b'\x1b\x69'  # ESC i (cut paper)
+ESC_ALIGN_LEFT = b'\x1b\x61\x00'  # ESC a 0
+ESC_ALIGN_CENTER = b'\x1b\x61\x01'  # ESC a 1
+ESC_ALIGN_RIGHT = b'\x1b\x61\x02'  # ESC a 2
+ESC_BOLD_ON = b'\x1b\x45\x01'  # ESC E 1
+ESC_BOLD_OFF = b'\x1b\x45\x00'  # ESC E 0
+
+# Alignment dispatch - anything unknown falls back to left
+_ALIGN_MAP = {'center': ESC_ALIGN_CENTER, 'right': ESC_ALIGN_RIGHT}
+
+# Chunk size for WritePrinter - 64 KiB matches typical USB bulk transfers
+# and lets the spooler start draining while later chunks are written
+WRITE_CHUNK_SIZE = 65536
+
+
+def _encode_set_command(cmd):
+    """
+    Encode a structured 'set' command into raw ESC/POS bytes.
+
+    Mirrors WindowsPrinter.set so a whole command list can be pre-encoded
+    into one payload instead of poking the printer buffer per command.
+
+    Args:
+        cmd (dict): Command like {'action': 'set', 'attribute': 'align',
+                    'value': 'center'}
+
+    Returns:
+        bytes: Encoded ESC/POS command, or b'' for unknown attributes
+    """
+    attr = cmd.get('attribute')
+    value = cmd.get('value')
+
+    if attr == 'align':
+        return _ALIGN_MAP.get(value, ESC_ALIGN_LEFT)
+
+    if attr in ('font', 'text_size'):
+        if value in ('b', 'bold'):
+            return ESC_BOLD_ON
+        return ESC_BOLD_OFF
+
+    return b''
+
+
+def _printer_caps(printer_instance):
+    """
+    Probe a printer instance's optional methods once.
+
+    print_data used to hasattr-probe flush/_raw/raw on every request;
+    doing it once at connect time turns those probes into dict lookups.
+
+    Returns:
+        dict: {'has_flush': bool, 'has__raw': bool, 'has_raw': bool}
+    """
+    return {
+        'has_flush': hasattr(printer_instance, 'flush'),
+        'has__raw': hasattr(printer_instance, '_raw'),
+        'has_raw': hasattr(printer_instance, 'raw'),
+    }
+
 
 def get_printer(printer_type, config):
     """
@@ -85,15 +304,14 @@ def get_printer(printer_type, config):
                 printer = File(config.get('file', 'LPT1'))
             elif printer_type == 'windows':
                 # Windows system printer by name
-                try:
-                    import win32print
+                if WIN32PRINT_AVAILABLE:
                     printer_name = config.get('printer_name')
                     if printer_name:
                         # Use custom Windows printer handler
                         printer = WindowsPrinter(printer_name)
                     else:
                         return None
-                except ImportError:
+                else:
                     # Fallback: try to use File type, but warn user
                     print("Warning: pywin32 not available. Windows printer may not work correctly.")
                     printer = File(config.get('printer_name', 'LPT1'))
@@ -144,7 +362,7 @@ class WindowsPrinter:
     
     Attributes:
         printer_name (str): Name of the Windows printer
-        buffer (bytearray): Internal buffer to collect print data before sending
+        buffer (list): Buffered bytes chunks, joined once at flush time
     
     Methods:
         text(text): Add text to print buffer
@@ -152,7 +370,7 @@ class WindowsPrinter:
         cut(): Add paper cut command to buffer
         set(**kwargs): Add formatting commands to buffer
         flush(): Send all buffered data to printer in one print job
-        close(): Cleanup (no-op, handles are closed after each flush)
+        close(): Close the cached spooler handle
     
     Example:
         >>> printer = WindowsPrinter("HP LaserJet")
@@ -170,61 +388,111 @@ class WindowsPrinter:
                                Windows Printers & Scanners settings
         """
         self.printer_name = printer_name
-        self.buffer = bytearray()  # Buffer to collect all data before printing
-    
-    def _add_to_buffer(self, data):
-        """Add data to buffer"""
-        if isinstance(data, str):
-            data = data.encode('utf-8', errors='ignore')
-        elif not isinstance(data, bytes):
+        # Buffered chunks are kept as a list of bytes and joined exactly
+        # once at flush time - appending to a list is cheap and avoids the
+        # extra full copy that bytes(bytearray) would make before the write
+        self.buffer = []
+        self._size = 0
+        # Spooler handle, opened lazily on first flush and kept for the
+        # printer's lifetime - OpenPrinter is a spooler RPC costing tens
+        # of ms, so re-opening per flush is wasteful
+        self._handle = None
+
+    def _get_handle(self):
+        """Open (once) and return the spooler handle for this printer"""
+        if self._handle is None:
+            self._handle = win32print.OpenPrinter(self.printer_name)
+        return self._handle
+
+    def _close_handle(self):
+        """Close the cached spooler handle, if open"""
+        if self._handle is not None:
+            try:
+                win32print.ClosePrinter(self._handle)
+            except Exception:
+                pass
+            self._handle = None
+
+    def _add_bytes(self, data):
+        """Add a bytes-like chunk to the buffer - no type sniffing"""
+        if not isinstance(data, bytes):
             data = bytes(data)
-        self.buffer.extend(data)
-    
+        self.buffer.append(data)
+        self._size += len(data)
+
+    def _add_str(self, data):
+        """Encode a str and add it to the buffer"""
+        data = data.encode('utf-8', errors='ignore')
+        self.buffer.append(data)
+        self._size += len(data)
+
     def _flush(self):
         """Send buffered data to printer in one print job"""
         if not self.buffer:
             return
-        
+
         try:
-            import win32print
-            # Open printer handle for this operation
-            handle = win32print.OpenPrinter(self.printer_name)
+            # Single join of all buffered chunks - the only copy on this path
+            payload = b''.join(self.buffer)
+            # Reuse the session handle; only document boundaries are per-flush
+            handle = self._get_handle()
+            # Send all buffered data in one print job
+            win32print.StartDocPrinter(handle, 1, (self.printer_name, None, "RAW"))
             try:
-                # Send all buffered data in one print job
-                win32print.StartDocPrinter(handle, 1, (self.printer_name, None, "RAW"))
+                win32print.StartPagePrinter(handle)
                 try:
-                    win32print.StartPagePrinter(handle)
-                    try:
-                        win32print.WritePrinter(handle, bytes(self.buffer))
-                    finally:
-                        win32print.EndPagePrinter(handle)
+                    # Write in chunks (still one print job) so the
+                    # spooler can start draining large payloads while
+                    # the rest is being submitted. WritePrinter accepts
+                    # any buffer-protocol object (pywin32 build >= 228),
+                    # so the memoryview slices go down without a bytes()
+                    # copy - the join above is the only copy on this path
+                    mv = memoryview(payload)
+                    for i in range(0, len(mv), WRITE_CHUNK_SIZE):
+                        win32print.WritePrinter(handle, mv[i:i + WRITE_CHUNK_SIZE])
                 finally:
-                    win32print.EndDocPrinter(handle)
+                    win32print.EndPagePrinter(handle)
             finally:
-                win32print.ClosePrinter(handle)
+                win32print.EndDocPrinter(handle)
             # Clear buffer after successful print
-            self.buffer = bytearray()
+            self.buffer = []
+            self._size = 0
         except Exception as e:
-            self.buffer = bytearray()  # Clear buffer on error
+            self.buffer = []  # Clear buffer on error
+            self._size = 0
+            self._close_handle()  # Handle may be stale after an error
             raise Exception(f"Print error: {e}")
     
     def text(self, text):
         """Add text to buffer (doesn't print immediately)"""
-        self._add_to_buffer(text)
-    
+        self._add_str(text)
+
     def _raw(self, data):
         """Add raw data to buffer (doesn't print immediately)"""
-        self._add_to_buffer(data)
-    
+        self._add_bytes(data)
+
     def cut(self):
         """Add cut command to buffer"""
-        # ESC/POS cut command: ESC i (0x1B 0x69)
-        cut_command = bytes([0x1B, 0x69])
-        self._add_to_buffer(cut_command)
+        self._add_bytes(ESC_CUT)
     
     def flush(self):
         """Flush buffer and send all buffered data to printer"""
         self._flush()
+
+    def write_bulk(self, parts):
+        """Append an iterable of pre-encoded bytes chunks in one call.
+
+        Lets callers that already assembled a whole job (e.g. a structured
+        ESC/POS command list) hand it over with a single join + append
+        instead of one buffer poke per command.
+        """
+        payload = b''.join(parts)
+        if not payload:
+            # Appending b'' would defeat _flush's empty-buffer check and
+            # submit a zero-byte job for an empty command list
+            return
+        self.buffer.append(payload)
+        self._size += len(payload)
     
     def set(self, **kwargs):
         """Set printer options (for compatibility) - adds to buffer"""
@@ -232,28 +500,22 @@ class WindowsPrinter:
         commands = []
         
         if 'align' in kwargs:
-            align = kwargs['align']
-            if align == 'center':
-                commands.append(bytes([0x1B, 0x61, 0x01]))  # ESC a 1
-            elif align == 'right':
-                commands.append(bytes([0x1B, 0x61, 0x02]))  # ESC a 2
-            else:  # left
-                commands.append(bytes([0x1B, 0x61, 0x00]))  # ESC a 0
-        
+            commands.append(_ALIGN_MAP.get(kwargs['align'], ESC_ALIGN_LEFT))
+
         if 'text_type' in kwargs or 'font' in kwargs:
             # Font size commands
             text_type = kwargs.get('text_type', kwargs.get('font', 'normal'))
             if text_type == 'b' or text_type == 'bold':
-                commands.append(bytes([0x1B, 0x45, 0x01]))  # ESC E 1 (bold on)
+                commands.append(ESC_BOLD_ON)
             else:
-                commands.append(bytes([0x1B, 0x45, 0x00]))  # ESC E 0 (bold off)
+                commands.append(ESC_BOLD_OFF)
         
         for cmd in commands:
-            self._add_to_buffer(cmd)  # Add to buffer instead of printing immediately
+            self._add_bytes(cmd)  # Add to buffer instead of printing immediately
     
     def close(self):
-        """Close printer connection (no-op, handles are closed after each operation)"""
-        pass
+        """Close printer connection (releases the cached spooler handle)"""
+        self._close_handle()
 
 
 @app.route('/health', methods=['GET'])
@@ -276,7 +538,7 @@ def health():
         }
     """
     try:
-        return jsonify({
+        return _json_response({
             'status': 'ok',
             'espos_available': ESCPOS_AVAILABLE,
             'printers_connected': len(printers),
@@ -285,7 +547,7 @@ def health():
     except Exception as e:
         if logger:
             logger.error(f"Health check error: {str(e)}")
-        return jsonify({
+        return _json_response({
             'status': 'error',
             'error': str(e)
         }), 500
@@ -333,51 +595,66 @@ def connect_printer():
     global printers
     
     try:
-        data = request.json
+        data = _parse_json_request()
         if not data:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'message': 'Request body must be JSON'
             }), 400
-        
+
+        error = _validation_error(_validate_connect, data)
+        if error:
+            return _json_response({
+                'success': False,
+                'message': f'Invalid request: {error}'
+            }), 400
+
         printer_id = data.get('printer_id') or data.get('name', 'printer_' + str(len(printers)))
         printer_name = data.get('name', printer_id)
         printer_type = data.get('type', 'usb')
         printer_config = data.get('config', {})
         
-        # If printer_id already exists, disconnect it first (auto-reconnect)
-        if printer_id in printers:
-            if logger:
-                logger.info(f"Printer '{printer_id}' already connected. Disconnecting and reconnecting...")
-            printer_info = printers[printer_id]
-            try:
-                if hasattr(printer_info['instance'], 'close'):
-                    printer_info['instance'].close()
-            except:
-                pass  # Ignore errors when closing
-            del printers[printer_id]
-        
-        printer_instance = get_printer(printer_type, printer_config)
-        
+        with _printers_lock:
+            # If printer_id already exists, disconnect it first (auto-reconnect)
+            if printer_id in printers:
+                if logger:
+                    logger.info(f"Printer '{printer_id}' already connected. Disconnecting and reconnecting...")
+                printer_info = printers[printer_id]
+                try:
+                    printer_info['executor'].shutdown(wait=False)
+                    if hasattr(printer_info['instance'], 'close'):
+                        printer_info['instance'].close()
+                except:
+                    pass  # Ignore errors when closing
+                del printers[printer_id]
+
+            printer_instance = get_printer(printer_type, printer_config)
+
+            if printer_instance:
+                printers[printer_id] = {
+                    'instance': printer_instance,
+                    'type': printer_type,
+                    'config': printer_config,
+                    'name': printer_name,
+                    'lock': threading.Lock(),
+                    # Single worker keeps async jobs to this printer ordered;
+                    # the thread is only spawned on the first submit
+                    'executor': ThreadPoolExecutor(max_workers=1),
+                    'caps': _printer_caps(printer_instance)
+                }
+
         if printer_instance:
-            printers[printer_id] = {
-                'instance': printer_instance,
-                'type': printer_type,
-                'config': printer_config,
-                'name': printer_name
-            }
-            
             if logger:
                 logger.info(f"Printer connected: id={printer_id}, name={printer_name}, type={printer_type}")
             
-            return jsonify({
+            return _json_response({
                 'success': True,
                 'message': f'Connected to {printer_name}',
                 'printer_id': printer_id,
                 'printer_name': printer_name
             })
         else:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'message': 'Failed to connect to printer'
             }), 400
@@ -385,7 +662,7 @@ def connect_printer():
     except Exception as e:
         if logger:
             logger.error(f"Connection error: {str(e)}")
-        return jsonify({
+        return _json_response({
             'success': False,
             'message': str(e)
         }), 500
@@ -419,43 +696,56 @@ def disconnect_printer():
     global printers
     
     try:
-        data = request.json or {}
+        data = _parse_json_request() or {}
+        error = _validation_error(_validate_disconnect, data)
+        if error:
+            return _json_response({
+                'success': False,
+                'message': f'Invalid request: {error}'
+            }), 400
+
         printer_id = data.get('printer_id')
-        
+
         if printer_id:
             # Disconnect specific printer
-            if printer_id in printers:
-                printer_info = printers[printer_id]
-                if hasattr(printer_info['instance'], 'close'):
-                    printer_info['instance'].close()
-                del printers[printer_id]
-                
+            with _printers_lock:
+                found = printer_id in printers
+                if found:
+                    printer_info = printers[printer_id]
+                    printer_info['executor'].shutdown(wait=False)
+                    if hasattr(printer_info['instance'], 'close'):
+                        printer_info['instance'].close()
+                    del printers[printer_id]
+
+            if found:
                 if logger:
                     logger.info(f"Printer disconnected: id={printer_id}")
                 
-                return jsonify({
+                return _json_response({
                     'success': True,
                     'message': f'Printer "{printer_id}" disconnected'
                 })
             else:
-                return jsonify({
+                return _json_response({
                     'success': False,
                     'message': f'Printer "{printer_id}" not found'
                 }), 404
         else:
             # Disconnect all printers
             disconnected_count = 0
-            for pid, printer_info in list(printers.items()):
-                if hasattr(printer_info['instance'], 'close'):
-                    printer_info['instance'].close()
-                disconnected_count += 1
-            
-            printers.clear()
-            
+            with _printers_lock:
+                for pid, printer_info in list(printers.items()):
+                    printer_info['executor'].shutdown(wait=False)
+                    if hasattr(printer_info['instance'], 'close'):
+                        printer_info['instance'].close()
+                    disconnected_count += 1
+
+                printers.clear()
+
             if logger:
                 logger.info(f"All printers disconnected: {disconnected_count} printers")
             
-            return jsonify({
+            return _json_response({
                 'success': True,
                 'message': f'All printers disconnected ({disconnected_count} printers)'
             })
@@ -463,12 +753,147 @@ def disconnect_printer():
     except Exception as e:
         if logger:
             logger.error(f"Disconnect error: {str(e)}")
-        return jsonify({
+        return _json_response({
             'success': False,
             'message': str(e)
         }), 500
 
 
+def _register_print_job(future):
+    """Track a background print future and return its polling job id"""
+    global _next_job_id
+    with _print_jobs_lock:
+        job_id = _next_job_id
+        _next_job_id += 1
+        _print_jobs[job_id] = future
+        if len(_print_jobs) > _PRINT_JOBS_MAX:
+            for jid in [j for j, f in _print_jobs.items() if f.done()]:
+                del _print_jobs[jid]
+    return job_id
+
+
+def _execute_print_job(printer_info, data):
+    """Run one print request against a connected printer.
+
+    Holds the printer's lock for the whole text/cut/flush sequence so
+    concurrent requests to the same printer can't interleave their bytes
+    inside the instance buffer. Called inline for synchronous requests
+    and from the printer's executor for "async": true requests.
+    """
+    printer_instance = printer_info['instance']
+    caps = printer_info['caps']  # capability flags probed at connect time
+    print_type = data.get('type', 'text')  # text, raw, escpos
+
+    with printer_info['lock']:
+        if print_type == 'text':
+            # Simple text printing - encode once at the HTTP boundary
+            # and hand bytes downstream, rather than paying a UTF-8
+            # encode inside the printer buffer for every call
+            text = data.get('data', '')
+            if isinstance(printer_instance, WindowsPrinter):
+                printer_instance._raw(text.encode('utf-8', 'ignore'))
+            else:
+                printer_instance.text(text)
+            # Don't flush yet if cut is requested - wait until after cut
+            if not data.get('cut', False):
+                # Flush buffer if using WindowsPrinter
+                if caps['has_flush']:
+                    printer_instance.flush()
+
+        elif print_type == 'raw':
+            # Raw ESC/POS commands (hex or base64 string, or byte array)
+            raw_data = data.get('data', '')
+            encoding = data.get('encoding', 'hex')
+            if not isinstance(raw_data, str):
+                # JSON list of ints - no string parsing needed at all
+                bytes_data = bytes(raw_data)
+            elif encoding == 'base64':
+                # Base64 decodes ~4x faster than hex and shrinks the
+                # wire payload by a third - preferred for image data
+                bytes_data = base64.b64decode(raw_data)
+            else:
+                # Fast path: bytes.fromhex is a single C-level scan and
+                # already tolerates spaces, which covers plain and
+                # space-separated hex without any intermediate copies
+                try:
+                    bytes_data = bytes.fromhex(raw_data)
+                except ValueError:
+                    # Slow path: strip 0x prefixes and other whitespace
+                    s = raw_data.translate(_HEX_STRIP)
+                    bytes_data = bytes.fromhex(s.replace('0x', '').replace('0X', ''))
+
+            # Use _raw method if available (WindowsPrinter or escpos)
+            if caps['has__raw']:
+                printer_instance._raw(bytes_data)
+                # Don't flush yet if cut is requested - wait until after cut
+                if not data.get('cut', False):
+                    # Flush buffer if using WindowsPrinter
+                    if caps['has_flush']:
+                        printer_instance.flush()
+            elif caps['has_raw']:
+                printer_instance.raw(bytes_data)
+            else:
+                # Fallback: encode as text
+                try:
+                    printer_instance.text(bytes_data.decode('latin1', errors='ignore'))
+                    if not data.get('cut', False):
+                        if caps['has_flush']:
+                            printer_instance.flush()
+                except:
+                    printer_instance.text(str(bytes_data))
+                    if not data.get('cut', False):
+                        if caps['has_flush']:
+                            printer_instance.flush()
+
+        elif print_type == 'escpos':
+            # ESC/POS commands using the library
+            commands = data.get('commands', [])
+            if isinstance(printer_instance, WindowsPrinter):
+                # Pre-encode the whole command list and hand it to the
+                # buffer in one append instead of one poke per command
+                parts = []
+                for cmd in commands:
+                    action = cmd['action']
+                    if action == 'text':
+                        parts.append(cmd.get('data', '').encode('utf-8', 'ignore'))
+                    elif action == 'cut':
+                        parts.append(ESC_CUT)
+                    elif action == 'set':
+                        encoded = _encode_set_command(cmd)
+                        if encoded:
+                            parts.append(encoded)
+                        # Add more attributes as needed
+                printer_instance.write_bulk(parts)
+            else:
+                for cmd in commands:
+                    if cmd['action'] == 'text':
+                        printer_instance.text(cmd.get('data', ''))
+                    elif cmd['action'] == 'cut':
+                        printer_instance.cut()
+                    elif cmd['action'] == 'set':
+                        attr = cmd.get('attribute')
+                        value = cmd.get('value')
+                        if attr == 'align':
+                            printer_instance.set(align=value)
+                        elif attr == 'font':
+                            printer_instance.set(font=value)
+                        elif attr == 'text_size':
+                            printer_instance.set(text_type=value)
+                        # Add more attributes as needed
+
+            # Flush buffer if using WindowsPrinter (send all commands in one job)
+            if caps['has_flush']:
+                printer_instance.flush()
+
+        # Auto-cut if requested
+        if data.get('cut', False):
+            printer_instance.cut()
+
+        # Flush buffer once at the end (sends all data including cut in one job)
+        if caps['has_flush']:
+            printer_instance.flush()
+
+
 @app.route('/printer/print', methods=['POST'])
 def print_data():
     """
@@ -478,13 +903,16 @@ def print_data():
         {
             "type": "text|raw|escpos",
             "data": "string or array",  // For 'text' or 'raw' type
+            "encoding": "hex|base64",  // For 'raw' type string data (default: hex)
             "commands": [...],      // For 'escpos' type
-            "cut": boolean           // Auto-cut paper after printing
+            "cut": boolean,          // Auto-cut paper after printing
+            "async": boolean         // Queue job in background, return 202 + job_id
         }
-    
+
     Print Types:
         - 'text': Simple text printing (data should be a string)
-        - 'raw': Raw ESC/POS commands (data can be hex string or byte array)
+        - 'raw': Raw ESC/POS commands (data can be a hex string, a base64
+                 string with "encoding": "base64", or a byte array)
         - 'escpos': Structured ESC/POS commands (commands array with actions)
     
     ESC/POS Commands Format:
@@ -512,200 +940,340 @@ def print_data():
         }
     """
     global printers
-    
-    # Try to get logger, fallback to print if not available
-    try:
-        log = logging.getLogger(__name__)
-    except:
-        log = None
-    
+
     try:
-        data = request.json
+        data = _parse_json_request()
         if not data:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'message': 'Request body must be JSON'
             }), 400
-        
+
+        error = _validation_error(_validate_print, data)
+        if error:
+            return _json_response({
+                'success': False,
+                'message': f'Invalid request: {error}'
+            }), 400
+
         printer_id = data.get('printer_id')
-        
+
         if not printer_id:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'message': 'printer_id is required. Specify which printer to use.'
             }), 400
         
-        if printer_id not in printers:
-            return jsonify({
+        with _printers_lock:
+            printer_info = printers.get(printer_id)
+
+        if printer_info is None:
+            return _json_response({
                 'success': False,
                 'message': f'Printer "{printer_id}" not connected. Connect it first using /printer/connect or /printer/connect-by-name.'
             }), 404
-        
-        printer_info = printers[printer_id]
-        printer_instance = printer_info['instance']
-        print_type = data.get('type', 'text')  # text, raw, escpos
-        
-        if log:
-            log.info(f"Print job received: printer_id={printer_id}, type={print_type}, cut={data.get('cut', False)}")
-        
-        if print_type == 'text':
-            # Simple text printing
-            text = data.get('data', '')
-            printer_instance.text(text)
-            # Don't flush yet if cut is requested - wait until after cut
-            if not data.get('cut', False):
-                # Flush buffer if using WindowsPrinter
-                if hasattr(printer_instance, 'flush'):
-                    printer_instance.flush()
-            
-        elif print_type == 'raw':
-            # Raw ESC/POS commands (hex string or byte array)
-            raw_data = data.get('data', '')
-            if isinstance(raw_data, str):
-                # Convert hex string to bytes
-                if raw_data.startswith('0x') or ' ' in raw_data:
-                    # Hex string format
-                    bytes_data = bytes.fromhex(raw_data.replace('0x', '').replace(' ', ''))
-                else:
-                    # Assume it's already a hex string
-                    bytes_data = bytes.fromhex(raw_data)
-            else:
-                bytes_data = bytes(raw_data)
-            
-            # Use _raw method if available (WindowsPrinter or escpos)
-            if hasattr(printer_instance, '_raw'):
-                printer_instance._raw(bytes_data)
-                # Don't flush yet if cut is requested - wait until after cut
-                if not data.get('cut', False):
-                    # Flush buffer if using WindowsPrinter
-                    if hasattr(printer_instance, 'flush'):
-                        printer_instance.flush()
-            elif hasattr(printer_instance, 'raw'):
-                printer_instance.raw(bytes_data)
-            else:
-                # Fallback: encode as text
-                try:
-                    printer_instance.text(bytes_data.decode('latin1', errors='ignore'))
-                    if not data.get('cut', False):
-                        if hasattr(printer_instance, 'flush'):
-                            printer_instance.flush()
-                except:
-                    printer_instance.text(str(bytes_data))
-                    if not data.get('cut', False):
-                        if hasattr(printer_instance, 'flush'):
-                            printer_instance.flush()
-            
-        elif print_type == 'escpos':
-            # ESC/POS commands using the library
-            commands = data.get('commands', [])
-            for cmd in commands:
-                if cmd['action'] == 'text':
-                    printer_instance.text(cmd.get('data', ''))
-                elif cmd['action'] == 'cut':
-                    printer_instance.cut()
-                elif cmd['action'] == 'set':
-                    attr = cmd.get('attribute')
-                    value = cmd.get('value')
-                    if attr == 'align':
-                        printer_instance.set(align=value)
-                    elif attr == 'font':
-                        printer_instance.set(font=value)
-                    elif attr == 'text_size':
-                        printer_instance.set(text_type=value)
-                    # Add more attributes as needed
-            
-            # Flush buffer if using WindowsPrinter (send all commands in one job)
-            if hasattr(printer_instance, 'flush'):
-                printer_instance.flush()
-        
-        # Auto-cut if requested
-        if data.get('cut', False):
-            printer_instance.cut()
-        
-        # Flush buffer once at the end (sends all data including cut in one job)
-        if hasattr(printer_instance, 'flush'):
-            printer_instance.flush()
-        
-        if log:
-            log.info(f"Print job sent successfully to printer '{printer_id}'")
-        
-        return jsonify({
+
+        # %-style args defer string formatting until a handler actually
+        # wants the record - nothing is built when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Print job received: printer_id=%s, type=%s, cut=%s",
+                        printer_id, data.get('type', 'text'), data.get('cut', False))
+
+        if data.get('async', False):
+            # Queue the job on this printer's single-worker executor and
+            # return immediately - the spooler round-trip for network
+            # printers can take hundreds of ms. Poll /printer/job/<id>.
+            future = printer_info['executor'].submit(
+                _execute_print_job, printer_info, data)
+            job_id = _register_print_job(future)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Print job %d queued for printer '%s'", job_id, printer_id)
+
+            return _json_response({
+                'success': True,
+                'message': f'Print job queued for {printer_info["name"]}',
+                'job_id': job_id
+            }), 202
+
+        _execute_print_job(printer_info, data)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Print job sent successfully to printer '%s'", printer_id)
+
+        return _json_response({
             'success': True,
             'message': f'Print job sent successfully to {printer_info["name"]}'
         })
         
     except Exception as e:
-        if log:
-            log.error(f"Print error: {str(e)}")
-        return jsonify({
+        logger.error("Print error: %s", e)
+        return _json_response({
             'success': False,
             'message': f'Print error: {str(e)}'
         }), 500
 
 
-def get_windows_printers():
-    """Get list of installed printers on Windows"""
-    printers = []
-    
-    # Try using win32print (best method)
-    try:
-        import win32print
-        import win32api
-        
-        printer_list = win32print.EnumPrinters(
-            win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
-        )
-        
-        for printer_info in printer_list:
-            printer_name = printer_info[2]
-            
-            # Get printer details
-            try:
-                printer_handle = win32print.OpenPrinter(printer_name)
-                printer_defaults = {"DesiredAccess": win32print.PRINTER_ACCESS_USE}
-                printer_details = win32print.GetPrinter(printer_handle, 2)
-                win32print.ClosePrinter(printer_handle)
-                
-                port_name = printer_details.get('pPortName', 'Unknown')
-                driver_name = printer_details.get('pDriverName', 'Unknown')
-                status = printer_details.get('Status', 0)
-                
-                # Determine connection type
-                connection_type = 'unknown'
-                if port_name.startswith('USB'):
-                    connection_type = 'usb'
-                elif port_name.startswith('COM') or port_name.startswith('LPT'):
-                    connection_type = 'serial'
-                elif ':' in port_name or port_name.startswith('\\\\'):
-                    connection_type = 'network'
-                
-                # Check if printer is ready
-                is_ready = status == 0
-                
-                printers.append({
-                    'name': printer_name,
-                    'port': port_name,
-                    'driver': driver_name,
-                    'type': connection_type,
-                    'status': 'ready' if is_ready else 'error',
-                    'system_printer': True
-                })
-            except Exception as e:
-                # If we can't get details, still add the printer with basic info
-                printers.append({
-                    'name': printer_name,
-                    'port': 'Unknown',
-                    'driver': 'Unknown',
-                    'type': 'unknown',
-                    'status': 'unknown',
-                    'system_printer': True,
-                    'error': str(e)
-                })
-        
+@app.route('/printer/job/<int:job_id>', methods=['GET'])
+def print_job_status(job_id):
+    """
+    Check the status of a background print job queued with "async": true.
+
+    Returns:
+        JSON response with status: "pending", "done" or "error"
+
+    Example Response:
+        {
+            "success": true,
+            "job_id": 3,
+            "status": "done"
+        }
+    """
+    with _print_jobs_lock:
+        future = _print_jobs.get(job_id)
+
+    if future is None:
+        return _json_response({
+            'success': False,
+            'message': f'Job {job_id} not found'
+        }), 404
+
+    if not future.done():
+        return _json_response({
+            'success': True,
+            'job_id': job_id,
+            'status': 'pending'
+        })
+
+    error = future.exception()
+    if error:
+        return _json_response({
+            'success': False,
+            'job_id': job_id,
+            'status': 'error',
+            'message': str(error)
+        })
+
+    return _json_response({
+        'success': True,
+        'job_id': job_id,
+        'status': 'done'
+    })
+
+
+# Cached OS printer enumeration. Enumerating system printers costs spooler
+# RPCs or subprocess forks on every call, and the installed set rarely
+# changes - so results are memoized per (system, epoch), where the epoch
+# advances every TTL seconds. Stale windows simply age out of the small
+# LRU; no timestamps to compare and no timer thread to run. The lock
+# serializes misses so concurrent requests can't fork parallel
+# wmic/lpstat storms - one request enumerates, the rest reuse its result.
+_printer_cache_lock = threading.Lock()
+_PRINTER_CACHE_TTL = 10.0  # seconds
+_refresh_epoch = 0  # bumped by explicit refreshes to start a new window
+
+# Shared executor for running the OS and USB printer probes concurrently
+# on a cache miss - module-level so threads are amortized across requests
+_probe_executor = ThreadPoolExecutor(max_workers=2)
+
+# Memoized USB string descriptors, keyed by (vendor, product, bus,
+# address). Fetching them is a synchronous control transfer per string;
+# device topology rarely changes, so pay it once per plugged device.
+_usb_string_cache = {}
+
+
+# Deletion table stripping whitespace from hex payloads before decoding
+_HEX_STRIP = str.maketrans('', '', ' \t\r\n')
+
+# Serial-style port prefixes used by _classify_port
+_SERIAL_PORT_PREFIXES = ('COM', 'LPT')
+
+# Matches queue names in lpstat -p output. A bytes pattern, so the
+# subprocess stdout is scanned in one pass without decoding it first
+_LPSTAT_RE = re.compile(rb'^printer (\S+)', re.M)
+
+
+def _classify_port(port):
+    """
+    Classify a printer port name into a connection type.
+
+    Args:
+        port (str): Port name as reported by the OS (e.g. 'USB001',
+                    'COM3', '192.168.1.50:9100', '\\\\server\\queue')
+
+    Returns:
+        str: One of 'usb', 'serial', 'network' or 'unknown'
+    """
+    if port.startswith('USB'):
+        return 'usb'
+    if port.startswith(_SERIAL_PORT_PREFIXES):
+        return 'serial'
+    if ':' in port or port.startswith('\\\\'):
+        return 'network'
+    return 'unknown'
+
+
+def _cache_epoch():
+    """Current cache window: advances every TTL seconds plus explicit bumps"""
+    return int(time.monotonic() // _PRINTER_CACHE_TTL) + _refresh_epoch
+
+
+@lru_cache(maxsize=4)
+def _enumerate_printers(system, epoch):
+    """Enumerate system printers, memoized per (system, epoch).
+
+    The epoch argument exists purely as a cache key - a new value forces
+    a fresh enumeration and lets the previous window age out of the LRU.
+    """
+    if system == 'Windows':
+        return _enumerate_windows_printers()
+    if system == 'Linux':
+        return _enumerate_linux_printers()
+    if system == 'Darwin':
+        return _enumerate_macos_printers()
+    return []
+
+
+def _get_cached_printers(system, refresh=False):
+    """Return the memoized printer list for the current TTL window.
+
+    A request that queued behind a concurrent refresh lands on the same
+    (system, epoch) key and reuses that refresh's result instead of
+    enumerating again.
+    """
+    global _refresh_epoch
+    with _printer_cache_lock:
+        if refresh:
+            _refresh_epoch += 1
+        return _enumerate_printers(system, _cache_epoch())
+
+
+def get_windows_printers(refresh=False):
+    """Get list of installed printers on Windows (cached for a short TTL)"""
+    return _get_cached_printers('Windows', refresh=refresh)
+
+
+def _enumerate_winspool_ctypes():
+    """
+    Enumerate Windows printers via ctypes on winspool.drv (no subprocess).
+
+    Fallback for hosts without pywin32: calls EnumPrintersW at level 2
+    in-process (~1ms) instead of paying a 200-2000ms PowerShell or WMIC
+    cold start.
+
+    Returns:
+        list: Printer dictionaries, or None if the ctypes call fails
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        winspool = ctypes.WinDLL('winspool.drv')
+
+        PRINTER_ENUM_LOCAL = 0x00000002
+        PRINTER_ENUM_CONNECTIONS = 0x00000004
+        flags = PRINTER_ENUM_LOCAL | PRINTER_ENUM_CONNECTIONS
+
+        class PRINTER_INFO_2W(ctypes.Structure):
+            _fields_ = [
+                ('pServerName', wintypes.LPWSTR),
+                ('pPrinterName', wintypes.LPWSTR),
+                ('pShareName', wintypes.LPWSTR),
+                ('pPortName', wintypes.LPWSTR),
+                ('pDriverName', wintypes.LPWSTR),
+                ('pComment', wintypes.LPWSTR),
+                ('pLocation', wintypes.LPWSTR),
+                ('pDevMode', ctypes.c_void_p),
+                ('pSepFile', wintypes.LPWSTR),
+                ('pPrintProcessor', wintypes.LPWSTR),
+                ('pDatatype', wintypes.LPWSTR),
+                ('pParameters', wintypes.LPWSTR),
+                ('pSecurityDescriptor', ctypes.c_void_p),
+                ('Attributes', wintypes.DWORD),
+                ('Priority', wintypes.DWORD),
+                ('DefaultPriority', wintypes.DWORD),
+                ('StartTime', wintypes.DWORD),
+                ('UntilTime', wintypes.DWORD),
+                ('Status', wintypes.DWORD),
+                ('cJobs', wintypes.DWORD),
+                ('AveragePPM', wintypes.DWORD),
+            ]
+
+        needed = wintypes.DWORD()
+        returned = wintypes.DWORD()
+
+        # First call probes the required buffer size
+        winspool.EnumPrintersW(flags, None, 2, None, 0,
+                               ctypes.byref(needed), ctypes.byref(returned))
+        if not needed.value:
+            return []
+
+        buf = ctypes.create_string_buffer(needed.value)
+        if not winspool.EnumPrintersW(flags, None, 2, buf, needed.value,
+                                      ctypes.byref(needed), ctypes.byref(returned)):
+            return None
+
+        info_array = ctypes.cast(buf, ctypes.POINTER(PRINTER_INFO_2W))
+        printers = []
+        for i in range(returned.value):
+            info = info_array[i]
+            port = info.pPortName or 'Unknown'
+            printers.append({
+                'name': info.pPrinterName or 'Unknown',
+                'port': port,
+                'driver': info.pDriverName or 'Unknown',
+                'type': _classify_port(port),
+                'status': 'ready' if info.Status == 0 else 'error',
+                'system_printer': True
+            })
         return printers
-        
-    except ImportError:
-        # Fallback to PowerShell/WMIC if win32print not available
+    except Exception:
+        return None
+
+
+def _enumerate_windows_printers():
+    """Enumerate installed printers on Windows (uncached)"""
+    printers = []
+
+    # Try using win32print (best method)
+    if WIN32PRINT_AVAILABLE:
+        # Level 2 returns full PRINTER_INFO_2 dicts in a single spooler RPC,
+        # so there is no need to OpenPrinter/GetPrinter each printer again
+        printer_list = win32print.EnumPrinters(
+            win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS,
+            None, 2
+        )
+
+        for printer_details in printer_list:
+            printer_name = printer_details.get('pPrinterName', 'Unknown')
+            port_name = printer_details.get('pPortName', 'Unknown')
+            driver_name = printer_details.get('pDriverName', 'Unknown')
+            status = printer_details.get('Status', 0)
+
+            # Determine connection type
+            connection_type = _classify_port(port_name)
+
+            # Check if printer is ready
+            is_ready = status == 0
+
+            printers.append({
+                'name': printer_name,
+                'port': port_name,
+                'driver': driver_name,
+                'type': connection_type,
+                'status': 'ready' if is_ready else 'error',
+                'system_printer': True
+            })
+
+        return printers
+
+    else:
+        # Prefer the pure-Python ctypes winspool call - in-process and fast
+        ctypes_printers = _enumerate_winspool_ctypes()
+        if ctypes_printers is not None:
+            return ctypes_printers
+
+        # Fallback to PowerShell/WMIC if ctypes fails too
         try:
             # Try PowerShell command
             ps_command = "Get-Printer | Select-Object Name, PortName, DriverName, PrinterStatus | ConvertTo-Json"
@@ -725,14 +1293,8 @@ def get_windows_printers():
                     
                     for p in ps_printers:
                         port = p.get('PortName', 'Unknown')
-                        connection_type = 'unknown'
-                        if port.startswith('USB'):
-                            connection_type = 'usb'
-                        elif port.startswith('COM') or port.startswith('LPT'):
-                            connection_type = 'serial'
-                        elif ':' in port or port.startswith('\\\\'):
-                            connection_type = 'network'
-                        
+                        connection_type = _classify_port(port)
+
                         printers.append({
                             'name': p.get('Name', 'Unknown'),
                             'port': port,
@@ -751,129 +1313,216 @@ def get_windows_printers():
         try:
             result = subprocess.run(
                 ['wmic', 'printer', 'get', 'name,portname,drivername', '/format:csv'],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
-            
+
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines[1:]:  # Skip header
-                    if line.strip():
-                        parts = line.split(',')
-                        if len(parts) >= 4:
-                            name = parts[-3].strip()
-                            port = parts[-2].strip()
-                            driver = parts[-1].strip()
-                            
-                            if name and name != 'Name':
-                                connection_type = 'unknown'
-                                if port.startswith('USB'):
-                                    connection_type = 'usb'
-                                elif port.startswith('COM') or port.startswith('LPT'):
-                                    connection_type = 'serial'
-                                elif ':' in port or port.startswith('\\\\'):
-                                    connection_type = 'network'
-                                
-                                printers.append({
-                                    'name': name,
-                                    'port': port,
-                                    'driver': driver,
-                                    'type': connection_type,
-                                    'status': 'ready',
-                                    'system_printer': True
-                                })
+                # wmic writes UTF-16LE (BOM-prefixed) when piped; decode
+                # by BOM sniff rather than trusting the locale codec
+                raw = result.stdout
+                if raw.startswith(b'\xff\xfe'):
+                    stdout = raw.decode('utf-16-le', 'replace').lstrip('\ufeff')
+                else:
+                    stdout = raw.decode('ascii', 'replace')
+                # csv.reader handles quoted fields, so printer names and
+                # drivers containing commas parse correctly, in one pass
+                reader = csv.reader(io.StringIO(stdout))
+                next(reader, None)  # Skip header
+                for row in reader:
+                    if len(row) >= 4:
+                        name = row[-3].strip()
+                        port = row[-2].strip()
+                        driver = row[-1].strip()
+
+                        if name and name != 'Name':
+                            connection_type = _classify_port(port)
+
+                            printers.append({
+                                'name': name,
+                                'port': port,
+                                'driver': driver,
+                                'type': connection_type,
+                                'status': 'ready',
+                                'system_printer': True
+                            })
         except:
             pass
     
     return printers
 
 
-def get_linux_printers():
-    """Get list of installed printers on Linux"""
+def get_linux_printers(refresh=False):
+    """Get list of installed printers on Linux (cached for a short TTL)"""
+    return _get_cached_printers('Linux', refresh=refresh)
+
+
+def _enumerate_cups_printers():
+    """Enumerate printers through the CUPS API (pycups), or None.
+
+    One in-process IPP call replaces the lpstat fork+exec and also
+    returns the device URI and driver, so ports are no longer 'Unknown'.
+    Returns None when pycups is missing or the CUPS daemon is
+    unreachable, so callers can fall back to lpstat.
+    """
+    try:
+        import cups
+    except ImportError:
+        return None
+
+    try:
+        cups_printers = cups.Connection().getPrinters()
+    except Exception:
+        return None
+
     printers = []
-    
+    for name, info in cups_printers.items():
+        uri = info.get('device-uri', 'Unknown')
+        if uri.startswith('usb:'):
+            connection_type = 'usb'
+        elif uri.startswith(('socket:', 'ipp:', 'ipps:', 'http:', 'https:', 'lpd:')):
+            connection_type = 'network'
+        elif uri.startswith('serial:'):
+            connection_type = 'serial'
+        else:
+            connection_type = 'unknown'
+
+        # printer-state 5 means stopped; 3 (idle) and 4 (processing) can
+        # both accept jobs
+        printers.append({
+            'name': name,
+            'port': uri,
+            'driver': info.get('printer-make-and-model', 'Unknown'),
+            'type': connection_type,
+            'status': 'ready' if info.get('printer-state', 3) != 5 else 'error',
+            'system_printer': True
+        })
+    return printers
+
+
+def _enumerate_linux_printers():
+    """Enumerate installed printers on Linux (uncached)"""
+    # Prefer the native CUPS API - no subprocess, richer metadata
+    cups_printers = _enumerate_cups_printers()
+    if cups_printers is not None:
+        return cups_printers
+
+    printers = []
+
     try:
-        # Use lpstat command
+        # Use lpstat command. Binary capture with a manual ASCII decode
+        # skips the locale codec and an extra buffer copy - CUPS queue
+        # names are ASCII, and stderr isn't read so it isn't piped.
         result = subprocess.run(
             ['lpstat', '-p', '-d'],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=10
         )
-        
+
         if result.returncode == 0:
-            current_printer = None
-            for line in result.stdout.split('\n'):
-                if line.startswith('printer '):
-                    # Extract printer name
-                    match = re.match(r'printer (\S+)', line)
-                    if match:
-                        current_printer = match.group(1)
-                        printers.append({
-                            'name': current_printer,
-                            'port': 'Unknown',
-                            'driver': 'Unknown',
-                            'type': 'unknown',
-                            'status': 'ready',
-                            'system_printer': True
-                        })
+            # One finditer pass over the undecoded stdout - no line
+            # splitting, no whole-buffer decode; only names are decoded
+            for match in _LPSTAT_RE.finditer(result.stdout):
+                printers.append({
+                    'name': match.group(1).decode('ascii', 'replace'),
+                    'port': 'Unknown',
+                    'driver': 'Unknown',
+                    'type': 'unknown',
+                    'status': 'ready',
+                    'system_printer': True
+                })
     except:
         pass
-    
+
     return printers
 
 
-def get_macos_printers():
+def get_macos_printers(refresh=False):
     """
     Get list of installed printers on macOS system.
-    
-    Uses lpstat command to query print system.
-    
+
+    Uses lpstat command to query print system. Results are cached for a
+    short TTL; pass refresh=True to force re-enumeration.
+
     Returns:
         list: List of printer dictionaries with basic information
-    
+
     Example:
         >>> printers = get_macos_printers()
     """
+    return _get_cached_printers('Darwin', refresh=refresh)
+
+
+def _enumerate_macos_printers():
+    """Enumerate installed printers on macOS (uncached)"""
+    # Prefer the native CUPS API - no subprocess, richer metadata
+    cups_printers = _enumerate_cups_printers()
+    if cups_printers is not None:
+        return cups_printers
+
     printers = []
-    
+
     try:
-        # Use lpstat command (same as Linux)
+        # Use lpstat command (same as Linux). Binary capture with a manual
+        # ASCII decode skips the locale codec and an extra buffer copy.
         result = subprocess.run(
             ['lpstat', '-p'],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=10
         )
-        
+
         if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'printer ' in line:
-                    match = re.search(r'printer (\S+)', line)
-                    if match:
-                        printer_name = match.group(1)
-                        printers.append({
-                            'name': printer_name,
-                            'port': 'Unknown',
-                            'driver': 'Unknown',
-                            'type': 'unknown',
-                            'status': 'ready',
-                            'system_printer': True
-                        })
+            # One finditer pass over the undecoded stdout - no line
+            # splitting, no whole-buffer decode; only names are decoded
+            for match in _LPSTAT_RE.finditer(result.stdout):
+                printers.append({
+                    'name': match.group(1).decode('ascii', 'replace'),
+                    'port': 'Unknown',
+                    'driver': 'Unknown',
+                    'type': 'unknown',
+                    'status': 'ready',
+                    'system_printer': True
+                })
     except:
         pass
     
     return printers
 
 
-def get_usb_printers():
+# USB base class code for printers, from the USB-IF class code table
+_USB_PRINTER_CLASS = 0x07
+
+
+def _is_printer_class(device):
+    """Check a device's config descriptor for a printer-class interface.
+
+    Interface class 0x07 identifies printers and is readable from the
+    already-fetched configuration descriptor - no string-descriptor
+    control transfer needed. Returns True/False, or None when the
+    descriptor can't be read (unconfigured device, permission denied)
+    so the caller can fall back to the name heuristic.
+    """
+    try:
+        config = device.get_active_configuration()
+    except Exception:
+        return None
+    for interface in config:
+        if interface.bInterfaceClass == _USB_PRINTER_CLASS:
+            return True
+    return False
+
+
+def get_usb_printers(refresh=False):
     """
     Get list of USB printers available for direct USB connection.
-    
-    Scans USB devices and identifies potential printers by checking device
-    names for 'print' or 'printer' keywords.
-    
+
+    Scans USB devices and identifies printers by their interface class
+    (0x07), falling back to 'print'/'printer' keywords in the device
+    name when class descriptors can't be read.
+
     Returns:
         list: List of USB printer dictionaries, each containing:
             - name (str): Device name
@@ -890,35 +1539,62 @@ def get_usb_printers():
         Requires pyusb library. Returns empty list if not available.
     """
     usb_printers = []
-    
+
+    if refresh:
+        _usb_string_cache.clear()
+
     if ESCPOS_AVAILABLE:
         try:
             import usb.core
             import usb.util
-            
+
             # Find all USB devices
             devices = usb.core.find(find_all=True)
             for device in devices:
                 try:
-                    vendor_name = 'Unknown'
-                    product_name = 'Unknown'
-                    
-                    if device.iManufacturer:
-                        try:
-                            vendor_name = usb.util.get_string(device, device.iManufacturer)
-                        except:
-                            pass
-                    
-                    if device.iProduct:
-                        try:
-                            product_name = usb.util.get_string(device, device.iProduct)
-                        except:
-                            pass
-                    
-                    # Only include devices that might be printers
-                    # (This is a heuristic - you might want to refine this)
-                    if 'print' in product_name.lower() or 'printer' in product_name.lower() or \
-                       'print' in vendor_name.lower() or 'printer' in vendor_name.lower():
+                    # Filter by interface class first: mice and webcams
+                    # are skipped without paying a single string-descriptor
+                    # control transfer
+                    is_printer = _is_printer_class(device)
+                    if is_printer is False:
+                        continue
+
+                    # String descriptor fetches are ms-scale control
+                    # transfers; memoize per physical device (bus+address
+                    # distinguishes two identical printers) so repeat
+                    # enumerations only read the descriptor table
+                    cache_key = (device.idVendor, device.idProduct,
+                                 device.bus, device.address)
+                    cached = _usb_string_cache.get(cache_key)
+                    if cached is not None:
+                        vendor_name, product_name = cached
+                    else:
+                        vendor_name = 'Unknown'
+                        product_name = 'Unknown'
+
+                        # No language ids means no string descriptors at
+                        # all - skip the fetches instead of letting them
+                        # raise and be swallowed
+                        if device.langids:
+                            if device.iManufacturer:
+                                try:
+                                    vendor_name = usb.util.get_string(device, device.iManufacturer)
+                                except usb.core.USBError:
+                                    pass
+
+                            if device.iProduct:
+                                try:
+                                    product_name = usb.util.get_string(device, device.iProduct)
+                                except usb.core.USBError:
+                                    pass
+
+                        _usb_string_cache[cache_key] = (vendor_name, product_name)
+
+                    # Class-7 devices are printers by definition; the name
+                    # heuristic only decides when the config descriptor
+                    # was unreadable
+                    if is_printer or 'print' in product_name.lower() or \
+                       'print' in vendor_name.lower():
                         usb_printers.append({
                             'name': f'{vendor_name} {product_name}',
                             'vendor_id': hex(device.idVendor),
@@ -933,8 +1609,10 @@ def get_usb_printers():
                                 'product_id': device.idProduct
                             }
                         })
-                except:
-                    pass
+                except usb.core.USBError:
+                    # Device vanished mid-scan or access was denied -
+                    # skip it without masking programming errors
+                    continue
         except ImportError:
             pass
         except Exception as e:
@@ -943,42 +1621,237 @@ def get_usb_printers():
     return usb_printers
 
 
-@app.route('/printer/list', methods=['GET'])
-def list_printers():
-    """List all available printers (system printers + USB printers)"""
-    global printer_list_cache
+def _serial_conn(port, printer, system):
+    """Connection settings for a COM/LPT port"""
+    return 'serial', {
+        'port': port,
+        'baudrate': 9600  # Default baudrate
+    }
+
+
+def _network_conn(port, printer, system):
+    """Connection settings for a host:port or UNC network port"""
+    if ':' in port:
+        host, _, tail = port.partition(':')
+        try:
+            return 'network', {'host': host, 'port': int(tail)}
+        except ValueError:
+            return 'network', {'host': host, 'port': 9100}
+    return 'network', {'host': port.replace('\\\\', ''), 'port': 9100}
+
+
+def _spooler_conn(port, printer, system):
+    """Default: the OS spooler on Windows, the file printer elsewhere"""
+    name = printer.get('name', 'Unknown')
+    if system == 'Windows':
+        return 'windows', {'printer_name': name}
+    return 'file', {'file': name}
+
+
+# Port classification table for _derive_connection: first matching
+# predicate wins, anything unmatched falls through to _spooler_conn
+_PORT_DISPATCH = (
+    (lambda p: p.startswith(_SERIAL_PORT_PREFIXES), _serial_conn),
+    (lambda p: ':' in p or p.startswith('\\\\'), _network_conn),
+)
+
+
+def _derive_connection(printer, system):
+    """Derive (connection_type, connection_config) for one printer row.
+
+    Runs once per row at enumeration time so connect_printer_by_name
+    doesn't re-branch over port prefixes on every connect request.
+    """
+    # USB printers carry a ready-made config from get_usb_printers
+    if printer.get('config'):
+        return 'usb', printer['config']
+
+    port = printer.get('port')
+    if port:
+        for predicate, handler in _PORT_DISPATCH:
+            if predicate(port):
+                return handler(port, printer, system)
+
+    return _spooler_conn(port or '', printer, system)
+
+
+def _annotate_printer(printer, idx):
+    """Fill in the name fallback, stable id and connection info for a row.
+
+    IDs are content hashes rather than list positions, so an ID cached
+    by a client stays valid across refreshes unless the printer's name,
+    port or USB ids actually change.
+    """
+    if 'name' not in printer:
+        printer['name'] = f'Printer {idx}'
+    key = '|'.join((
+        printer['name'],
+        str(printer.get('port', '')),
+        str(printer.get('vendor_id', '')),
+        str(printer.get('product_id', ''))
+    ))
+    printer['id'] = hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+    conn_type, conn_config = _derive_connection(printer, _SYSTEM)
+    printer['_conn_type'] = conn_type
+    printer['_conn_config'] = conn_config
+
+
+def _publish_printer_list(all_printers):
+    """Publish a built list, its lookup indexes and ETag atomically.
+
+    Everything is written together under the cache lock so a concurrent
+    build can't leave readers with an index or ETag from a different
+    list revision.
+    """
+    global printer_list_cache, printer_id_index, printer_name_index
+    global _printer_list_etag
+
+    # Digest the serialized list so /printer/list can answer 304s
+    if ORJSON_AVAILABLE:
+        serialized = orjson.dumps(all_printers)
+    else:
+        serialized = json.dumps(all_printers, sort_keys=True).encode('utf-8')
+    etag = hashlib.blake2b(serialized, digest_size=8).hexdigest()
+
+    with _printer_cache_lock:
+        printer_list_cache = all_printers
+        printer_id_index = {p['id']: p for p in all_printers}
+        printer_name_index = {p['name']: p for p in all_printers}
+        _printer_list_etag = etag
+
+
+def _build_printer_list(refresh=False):
+    """Assemble the full printer list (system + USB) and cache it.
+
+    Shared by the /printer/list view and connect_printer_by_name so the
+    latter can fill an empty cache without re-entering the view function.
+    """
     all_printers = []
-    
-    # Get system-installed printers based on OS
-    system_printers = []
-    if platform.system() == 'Windows':
-        system_printers = get_windows_printers()
-    elif platform.system() == 'Linux':
-        system_printers = get_linux_printers()
-    elif platform.system() == 'Darwin':  # macOS
-        system_printers = get_macos_printers()
-    
-    all_printers.extend(system_printers)
-    
-    # Also get direct USB printers (for raw USB connection)
-    usb_printers = get_usb_printers()
-    all_printers.extend(usb_printers)
-    
-    # Add ID to each printer for easy reference
+
+    # Pick the system probe based on OS
+    if _IS_WINDOWS:
+        system_fn = get_windows_printers
+    elif _IS_LINUX:
+        system_fn = get_linux_printers
+    elif _IS_DARWIN:
+        system_fn = get_macos_printers
+    else:
+        system_fn = None
+
+    # Both probes are I/O-bound (spooler RPC / subprocess wait vs USB
+    # control transfers), so running them concurrently makes the wall
+    # time max() of the two instead of their sum. Collect in fixed order
+    # to keep the printer ids stable: system printers first, then USB.
+    if system_fn is not None:
+        system_future = _probe_executor.submit(system_fn, refresh)
+        usb_printers = get_usb_printers(refresh=refresh)
+        all_printers.extend(system_future.result())
+        all_printers.extend(usb_printers)
+    else:
+        all_printers.extend(get_usb_printers(refresh=refresh))
+
+    # Add ID to each printer for easy reference, and precompute how each
+    # one would be connected so the connect path is a plain dict read.
+    # The probe results come out of lru_cache, so the same row dicts are
+    # shared by every request in a TTL window - annotate copies so
+    # concurrent builds never mutate a row another thread is serializing
+    # and the cache entries stay pure enumeration output.
+    all_printers = [dict(p) for p in all_printers]
     for idx, printer in enumerate(all_printers):
-        printer['id'] = idx
-        if 'name' not in printer:
-            printer['name'] = f'Printer {idx}'
-    
-    # Cache the printer list
-    printer_list_cache = all_printers
-    
-    return jsonify({
+        _annotate_printer(printer, idx)
+
+    _publish_printer_list(all_printers)
+    return all_printers
+
+
+def _iter_printers(refresh=False):
+    """Yield annotated printer rows as each probe delivers its results.
+
+    The system and USB probes run concurrently; whichever finishes first
+    has its rows yielded immediately, so a streaming client sees the
+    fast source without waiting on the slow one. The completed list is
+    published to the cache at the end, same as _build_printer_list.
+    """
+    if _IS_WINDOWS:
+        system_fn = get_windows_printers
+    elif _IS_LINUX:
+        system_fn = get_linux_printers
+    elif _IS_DARWIN:
+        system_fn = get_macos_printers
+    else:
+        system_fn = None
+
+    results = queue.Queue()
+
+    def run_probe(probe):
+        try:
+            results.put(probe(refresh))
+        except Exception as e:
+            logger.error("Printer probe failed: %s", e)
+            results.put([])
+
+    probes = [p for p in (system_fn, get_usb_printers) if p is not None]
+    for probe in probes:
+        _probe_executor.submit(run_probe, probe)
+
+    all_printers = []
+    idx = 0
+    for _ in probes:
+        for printer in results.get():
+            # Copy before annotating - the probe rows are shared through
+            # lru_cache, same as in _build_printer_list
+            printer = dict(printer)
+            _annotate_printer(printer, idx)
+            idx += 1
+            all_printers.append(printer)
+            yield printer
+
+    _publish_printer_list(all_printers)
+
+
+@app.route('/printer/list', methods=['GET'])
+def list_printers():
+    """List all available printers (system printers + USB printers).
+
+    System printer enumeration is cached for a short TTL; pass ?refresh=1
+    (or ?force=1) to force a fresh scan. With ?stream=1 the response is
+    chunked JSON, emitting printers as each probe completes.
+    """
+    refresh = (request.args.get('refresh') in ('1', 'true', 'yes')
+               or request.args.get('force') in ('1', 'true', 'yes'))
+
+    if request.args.get('stream') in ('1', 'true', 'yes'):
+        # Opt-in streaming: rows go out as each probe finishes, so the
+        # fast source renders before the slow one completes. The default
+        # buffered path below keeps the ETag/304 behavior.
+        def generate():
+            count = 0
+            yield b'{"printers":['
+            for printer in _iter_printers(refresh=refresh):
+                if count:
+                    yield b','
+                yield _json_bytes(printer)
+                count += 1
+            yield (b'],"count":' + str(count).encode('ascii') +
+                   b',"system":' + _json_bytes(_SYSTEM) + b'}')
+
+        return app.response_class(stream_with_context(generate()),
+                                  mimetype='application/json')
+
+    all_printers = _build_printer_list(refresh=refresh)
+
+    # Poll-with-no-change fast path: skip the body and its serialization
+    if request.headers.get('If-None-Match') == _printer_list_etag:
+        return ('', 304)
+
+    response = _json_response({
         'printers': all_printers,
         'count': len(all_printers),
-        'system': platform.system(),
+        'system': _SYSTEM,
         'note': 'System printers can be used via their port. USB printers can be connected directly.'
     })
+    response.headers['ETag'] = _printer_list_etag
+    return response
 
 
 @app.route('/printer/connect-by-name', methods=['POST'])
@@ -993,7 +1866,7 @@ def connect_printer_by_name():
     Request Body (JSON):
         {
             "name": "Printer Name",  // OR
-            "id": 0                 // Printer ID from /printer/list
+            "id": "8f4e2c1a9b7d6e03"  // Printer ID from /printer/list
         }
     
     Returns:
@@ -1002,7 +1875,7 @@ def connect_printer_by_name():
     Example Request:
         POST /printer/connect-by-name
         {
-            "id": 0
+            "id": "8f4e2c1a9b7d6e03"
         }
     
     Example Response:
@@ -1023,9 +1896,9 @@ def connect_printer_by_name():
     global printers, printer_list_cache
     
     try:
-        data = request.json
+        data = _parse_json_request()
         if not data:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'message': 'Request body must be JSON'
             }), 400
@@ -1035,129 +1908,70 @@ def connect_printer_by_name():
         
         # Refresh printer list if cache is empty
         if not printer_list_cache:
-            # Trigger list refresh
-            list_printers()
+            _build_printer_list()
         
-        # Find the printer by name or ID
+        # Find the printer by ID or name - indexed, no list scan. Older
+        # clients sent names in the 'id' field (and vice versa), so each
+        # value is tried against both indexes.
         selected_printer = None
         if printer_id is not None:
-            # Find by ID
-            for p in printer_list_cache:
-                if p.get('id') == printer_id:
-                    selected_printer = p
-                    break
-        elif printer_name:
-            # Find by name
-            for p in printer_list_cache:
-                if p.get('name') == printer_name:
-                    selected_printer = p
-                    break
+            selected_printer = (printer_id_index.get(printer_id)
+                                or printer_name_index.get(printer_id))
+        if selected_printer is None and printer_name:
+            selected_printer = (printer_name_index.get(printer_name)
+                                or printer_id_index.get(printer_name))
         
         if not selected_printer:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'message': f'Printer not found: {printer_name or printer_id}'
             }), 404
         
-        # Determine connection type and config from printer info
-        connection_type = None
-        connection_config = {}
-        
-        # Check if it's a USB printer with direct config
-        if selected_printer.get('config'):
-            connection_type = 'usb'
-            connection_config = selected_printer['config']
-        elif selected_printer.get('port'):
-            port = selected_printer['port']
-            # Determine type from port
-            if port.startswith('COM') or port.startswith('LPT'):
-                connection_type = 'serial'
-                connection_config = {
-                    'port': port,
-                    'baudrate': 9600  # Default baudrate
-                }
-            elif ':' in port or port.startswith('\\\\'):
-                # Network printer
-                connection_type = 'network'
-                if ':' in port:
-                    parts = port.split(':')
-                    connection_config = {
-                        'host': parts[0],
-                        'port': int(parts[1]) if len(parts) > 1 else 9100
-                    }
-                else:
-                    connection_config = {
-                        'host': port.replace('\\\\', ''),
-                        'port': 9100
-                    }
-            elif port.startswith('USB'):
-                # USB port on Windows - use Windows printing API
-                if platform.system() == 'Windows':
-                    connection_type = 'windows'
-                    connection_config = {
-                        'printer_name': selected_printer['name']
-                    }
-                else:
-                    connection_type = 'file'
-                    connection_config = {
-                        'file': selected_printer['name']
-                    }
-            else:
-                # Fallback: use Windows API if on Windows
-                if platform.system() == 'Windows':
-                    connection_type = 'windows'
-                    connection_config = {
-                        'printer_name': selected_printer['name']
-                    }
-                else:
-                    connection_type = 'file'
-                    connection_config = {
-                        'file': selected_printer['name']
-                    }
-        else:
-            # Fallback: try using Windows API if on Windows, otherwise file
-            if platform.system() == 'Windows':
-                connection_type = 'windows'
-                connection_config = {
-                    'printer_name': selected_printer['name']
-                }
-            else:
-                connection_type = 'file'
-                connection_config = {
-                    'file': selected_printer['name']
-                }
-        
+        # Connection type and config were precomputed when the printer
+        # list was built - see _derive_connection
+        connection_type = selected_printer['_conn_type']
+        connection_config = selected_printer['_conn_config']
+
+
         # Get printer_id from request or use printer name
         printer_id = data.get('printer_id') or selected_printer.get('name', 'printer_' + str(len(printers)))
         printer_name = selected_printer.get('name', 'Unknown')
         
-        # If printer_id already exists, disconnect it first (auto-reconnect)
-        if printer_id in printers:
-            if logger:
-                logger.info(f"Printer '{printer_id}' already connected. Disconnecting and reconnecting...")
-            printer_info = printers[printer_id]
-            try:
-                if hasattr(printer_info['instance'], 'close'):
-                    printer_info['instance'].close()
-            except:
-                pass  # Ignore errors when closing
-            del printers[printer_id]
-        
-        # Connect using determined type and config
-        printer_instance = get_printer(connection_type, connection_config)
-        
+        with _printers_lock:
+            # If printer_id already exists, disconnect it first (auto-reconnect)
+            if printer_id in printers:
+                if logger:
+                    logger.info(f"Printer '{printer_id}' already connected. Disconnecting and reconnecting...")
+                printer_info = printers[printer_id]
+                try:
+                    printer_info['executor'].shutdown(wait=False)
+                    if hasattr(printer_info['instance'], 'close'):
+                        printer_info['instance'].close()
+                except:
+                    pass  # Ignore errors when closing
+                del printers[printer_id]
+
+            # Connect using determined type and config
+            printer_instance = get_printer(connection_type, connection_config)
+
+            if printer_instance:
+                printers[printer_id] = {
+                    'instance': printer_instance,
+                    'type': connection_type,
+                    'config': connection_config,
+                    'name': printer_name,
+                    'lock': threading.Lock(),
+                    # Single worker keeps async jobs to this printer ordered;
+                    # the thread is only spawned on the first submit
+                    'executor': ThreadPoolExecutor(max_workers=1),
+                    'caps': _printer_caps(printer_instance)
+                }
+
         if printer_instance:
-            printers[printer_id] = {
-                'instance': printer_instance,
-                'type': connection_type,
-                'config': connection_config,
-                'name': printer_name
-            }
-            
             if logger:
                 logger.info(f"Printer connected by name: id={printer_id}, name={printer_name}, type={connection_type}")
             
-            return jsonify({
+            return _json_response({
                 'success': True,
                 'message': f'Connected to printer: {printer_name}',
                 'printer_id': printer_id,
@@ -1165,7 +1979,7 @@ def connect_printer_by_name():
                 'connection_type': connection_type
             })
         else:
-            return jsonify({
+            return _json_response({
                 'success': False,
                 'message': f'Failed to connect to printer: {printer_name}'
             }), 400
@@ -1173,7 +1987,7 @@ def connect_printer_by_name():
     except Exception as e:
         if logger:
             logger.error(f"Connect by name error: {str(e)}")
-        return jsonify({
+        return _json_response({
             'success': False,
             'message': str(e)
         }), 500
@@ -1208,7 +2022,9 @@ def list_connected_printers():
     """
     try:
         connected = []
-        for printer_id, printer_info in printers.items():
+        with _printers_lock:
+            snapshot = list(printers.items())
+        for printer_id, printer_info in snapshot:
             connected.append({
                 'printer_id': printer_id,
                 'name': printer_info['name'],
@@ -1216,14 +2032,14 @@ def list_connected_printers():
                 'status': 'connected'
             })
         
-        return jsonify({
+        return _json_response({
             'printers': connected,
             'count': len(connected)
         })
     except Exception as e:
         if logger:
             logger.error(f"List connected printers error: {str(e)}")
-        return jsonify({
+        return _json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -1234,7 +2050,7 @@ def internal_error(error):
     """Handle internal server errors"""
     if logger:
         logger.error(f"Internal server error: {str(error)}")
-    return jsonify({
+    return _json_response({
         'success': False,
         'error': 'Internal server error',
         'message': str(error) if logger else 'An error occurred'
@@ -1244,13 +2060,16 @@ def internal_error(error):
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
+    return _json_response({
         'success': False,
         'error': 'Not found',
         'message': 'The requested endpoint was not found'
     }), 404
 
 
+# Worker threads for the waitress server
+SERVER_THREADS = 8
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Simple Print Server - Thermal Printer Bridge")
@@ -1258,7 +2077,14 @@ if __name__ == '__main__':
     print(f"ESC/POS Library Available: {ESCPOS_AVAILABLE}")
     print("Server starting on http://localhost:8888")
     print("=" * 60)
-    
-    # Run the server
-    app.run(host='127.0.0.1', port=8888, debug=False)
+
+    # Run the server - prefer waitress (a real thread pool, so concurrent
+    # print requests are handled in parallel; per-printer locks keep jobs
+    # to the same printer serialized)
+    try:
+        from waitress import serve
+        serve(app, host='127.0.0.1', port=8888, threads=SERVER_THREADS)
+    except ImportError:
+        print("Warning: waitress not installed. Using Flask dev server.")
+        app.run(host='127.0.0.1', port=8888, debug=False, threaded=True)
 